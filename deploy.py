@@ -4,10 +4,15 @@ Zentickr Deployment Script
 Automated deployment and setup for Zentickr MCP Server
 """
 
+import argparse
+import importlib
 import os
+import shutil
 import subprocess
 import sys
 import platform
+import threading
+from collections import deque
 from pathlib import Path
 
 # Windows-compatible symbols
@@ -34,15 +39,32 @@ def print_banner():
     """
     print(banner)
 
+def read_tail(stream, tail):
+    """Read a stream line by line, keeping only the last few (truncated) lines"""
+    for line in stream:
+        tail.append(line.rstrip()[:200])
+
 def run_command(command, description, critical=True):
-    """Run a command and handle results"""
+    """Run a command (an argv list) and handle results"""
     print(f"\n{ARROW} {description}...")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True, encoding='utf-8', errors='replace')
+        # Stream the output instead of buffering it all; we only ever show the tail
+        stdout_tail = deque(maxlen=4)
+        stderr_tail = deque(maxlen=4)
+        with subprocess.Popen(command, shell=False, close_fds=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                              bufsize=-1, text=True, encoding='utf-8', errors='replace') as process:
+            # Drain stderr on a thread (pipes can't be select()ed on Windows) so neither pipe fills up
+            stderr_reader = threading.Thread(target=read_tail, args=(process.stderr, stderr_tail), daemon=True)
+            stderr_reader.start()
+            read_tail(process.stdout, stdout_tail)
+            stderr_reader.join()
+            returncode = process.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, command, "\n".join(stdout_tail), "\n".join(stderr_tail))
         print(f"{CHECK} {description} - SUCCESS")
-        if result.stdout.strip():
+        if any(stdout_tail):
             # Limit output length to avoid clutter
-            output = result.stdout.strip()
+            output = "\n".join(stdout_tail).strip()
             if len(output) > 200:
                 output = output[:200] + "..."
             print(f"   Output: {output}")
@@ -72,14 +94,14 @@ def check_python_version():
         print(f"{CROSS} Python {version.major}.{version.minor}.{version.micro} - Requires Python 3.10+")
         return False
 
-def setup_environment():
-    """Set up the development environment"""
+def setup_environment(use_uv=True):
+    """Set up the development environment (with uv when available, unless use_uv is False)"""
     print(f"\n{ARROW} Setting up Zentickr environment...")
     
     # Check for virtual environment
     venv_path = Path("env")
     if not venv_path.exists():
-        if not run_command(f"{sys.executable} -m venv env", "Creating virtual environment"):
+        if not run_command([sys.executable, "-m", "venv", "env"], "Creating virtual environment"):
             return False
     else:
         print(f"{CHECK} Virtual environment already exists")
@@ -93,81 +115,69 @@ def setup_environment():
         python_cmd = "env/bin/python"
     
     # Upgrade pip
-    run_command(f"{pip_cmd} install --upgrade pip", "Upgrading pip", critical=False)
+    run_command([pip_cmd, "install", "--upgrade", "pip"], "Upgrading pip", critical=False)
     
-    # Install requirements
-    if not run_command(f"{pip_cmd} install -r requirements.txt", "Installing dependencies"):
+    # Install requirements, using uv's much faster resolver/installer when it is on PATH
+    uv_path = shutil.which("uv") if use_uv else None
+    if uv_path:
+        install_cmd = [uv_path, "pip", "install", "--python", python_cmd]
+        suffix = " (uv)"
+    else:
+        install_cmd = [pip_cmd, "install"]
+        suffix = ""
+    if not run_command(install_cmd + ["-r", "requirements.txt"], f"Installing dependencies{suffix}"):
         return False
     
-    # Install package in development mode
-    run_command(f"{pip_cmd} install -e .", "Installing Zentickr package", critical=False)
+    # Install package in development mode; kept separate and optional because the
+    # project metadata lives in project.toml, which pip and uv do not recognise
+    run_command(install_cmd + ["-e", "."], f"Installing Zentickr package{suffix}", critical=False)
     
     return True
 
-def test_installation():
-    """Test if the installation works"""
-    print(f"\n{ARROW} Testing installation...")
-    
-    # Test basic imports
-    test_script = '''
-import sys
-import os
-print("Testing core dependencies...")
-try:
-    import yahooquery
-    print("[OK] yahooquery imported")
-    
-    import pandas
-    print("[OK] pandas imported")
-    
-    import mcp
-    print("[OK] mcp imported")
-    
-    print("[OK] All core dependencies imported successfully")
+def run_installation_checks():
+    """Import core dependencies and query Yahoo Finance in the current interpreter"""
+    print("Testing core dependencies...")
+    try:
+        for module in ("yahooquery", "pandas", "mcp"):
+            importlib.import_module(module)
+            print(f"{CHECK} {module} imported")
+        print(f"{CHECK} All core dependencies imported successfully")
+    except ImportError as e:
+        print(f"{CROSS} Import error: {e}")
+        return False
     
     # Test Yahoo Finance connection
-    print("Testing Yahoo Finance API...")
-    from yahooquery import Ticker
-    ticker = Ticker("AAPL")
-    data = ticker.price
-    if data and "AAPL" in data:
-        print("[OK] Yahoo Finance API connection successful")
-    else:
-        print("[WARN] Yahoo Finance API returned empty data")
-        
-    print("[SUCCESS] Zentickr is ready to run!")
-    sys.exit(0)
-except ImportError as e:
-    print(f"[FAIL] Import error: {e}")
-    sys.exit(1)
-except Exception as e:
-    print(f"[WARN] Warning: {e}")
-    print("[INFO] Some issues detected but server may still work")
-    sys.exit(0)
-'''
+    try:
+        print("Testing Yahoo Finance API...")
+        from yahooquery import Ticker
+        data = Ticker("AAPL").price
+        if data and "AAPL" in data:
+            print(f"{CHECK} Yahoo Finance API connection successful")
+        else:
+            print(f"{WARNING} Yahoo Finance API returned empty data")
+    except Exception as e:
+        print(f"{WARNING} Warning: {e}")
+        print("[INFO] Some issues detected but server may still work")
+    
+    print(f"{CHECK} Zentickr is ready to run!")
+    return True
+
+def test_installation(isolated=False):
+    """Test if the installation works"""
+    print(f"\n{ARROW} Testing installation...")
     
     if platform.system() == "Windows":
         python_cmd = "env\\Scripts\\python"
     else:
         python_cmd = "env/bin/python"
     
-    # Write test script to temporary file
-    try:
-        with open("test_installation.py", "w", encoding='utf-8') as f:
-            f.write(test_script)
-        
-        success = run_command(f"{python_cmd} test_installation.py", "Running installation test")
-        
-        # Clean up test file
-        try:
-            os.remove("test_installation.py")
-        except:
-            pass
-        
-        return success
-    except Exception as e:
-        print(f"{CROSS} Could not create test file: {e}")
-        return False
+    # Run the checks in-process when we are already the environment's interpreter
+    if not isolated and Path(sys.prefix).resolve() == Path("env").resolve():
+        return run_installation_checks()
+    
+    # Otherwise the packages live in the env interpreter, so run the same checks there
+    check = "import sys, deploy; sys.exit(0 if deploy.run_installation_checks() else 1)"
+    return run_command([python_cmd, "-c", check], "Running installation test")
 
 def show_launch_instructions():
     """Show instructions for launching the app"""
@@ -224,8 +234,17 @@ def show_launch_instructions():
     print("   * Implement authentication")
     print("   * Scale horizontally")
 
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Deploy the Zentickr MCP server")
+    parser.add_argument("--no-uv", action="store_true", help="install with pip even if uv is available")
+    parser.add_argument("--isolated", action="store_true", help="always run the installation test in a separate interpreter")
+    return parser.parse_args()
+
 def main():
     """Main deployment function"""
+    args = parse_args()
+    
     # Set console encoding for Windows
     if platform.system() == "Windows":
         try:
@@ -245,12 +264,12 @@ def main():
         return False
     
     # Setup environment
-    if not setup_environment():
+    if not setup_environment(use_uv=not args.no_uv):
         print(f"\n{CROSS} Environment setup failed. Please check errors above.")
         return False
     
     # Test installation
-    if not test_installation():
+    if not test_installation(isolated=args.isolated):
         print(f"\n{WARNING} Installation test had issues, but you can still try to run the server.")
     
     # Show launch instructions
@@ -9,15 +9,19 @@ import sys
 from pathlib import Path
 
 def run_command(command, description):
-    """Run a command and handle errors"""
+    """Run a command (an argv list) and handle errors"""
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        result = subprocess.run(command, shell=False, close_fds=False, check=True, capture_output=True, text=True)
         print(f"✅ {description} completed successfully")
         return result
     except subprocess.CalledProcessError as e:
         print(f"❌ {description} failed: {e.stderr}")
         return None
+    except OSError as e:
+        # Without a shell, a missing executable raises instead of exiting with 127
+        print(f"❌ {description} failed: {e}")
+        return None
 
 def main():
     """Main setup function"""
@@ -27,7 +31,7 @@ def main():
     venv_path = Path("env")
     if not venv_path.exists():
         print("📦 Creating virtual environment...")
-        run_command(f"{sys.executable} -m venv env", "Virtual environment creation")
+        run_command([sys.executable, "-m", "venv", "env"], "Virtual environment creation")
     else:
         print("✅ Virtual environment already exists")
     
@@ -41,11 +45,12 @@ def main():
     
     # Install dependencies
     print("\n📋 Installing dependencies...")
-    run_command(f"{pip_command} install -r requirements.txt", "Dependencies installation")
+    run_command([pip_command, "install", "-r", "requirements.txt"], "Dependencies installation")
     
-    # Install package in development mode
+    # Install package in development mode; separate so a failure here (there is no
+    # pyproject.toml/setup.py, only project.toml) doesn't block the dependencies
     print("\n🔧 Installing package in development mode...")
-    run_command(f"{pip_command} install -e .", "Development installation")
+    run_command([pip_command, "install", "-e", "."], "Development installation")
     
     print("\n✨ Setup complete! You can now run the server using:")
     print("   - Windows: .\\run_server.bat")
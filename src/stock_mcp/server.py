@@ -7,259 +7,376 @@ Exposes financial data, market information, and historical prices as tools.
 """
 
 import asyncio
+import copy
+import functools
 import json
-from typing import Any, Dict, List, Optional
+import math
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 from datetime import datetime, timedelta
 
+from cachetools import TTLCache
 from mcp.server.fastmcp import FastMCP
-from yahooquery import Ticker
-import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional speedup, unavailable on Windows
+    uvloop = None
+
+if TYPE_CHECKING:
+    from yahooquery import Ticker
+
+# pandas and yahooquery are imported on first use; pandas alone adds ~400 ms to start-up
+_pd = None
+_Ticker = None
+
+# Helper function to import the heavy data dependencies lazily
+def _lazy():
+    """Import pandas and yahooquery on first use and return (pandas, Ticker)."""
+    global _pd, _Ticker
+    if _Ticker is None:
+        import pandas as pd
+        from yahooquery import Ticker
+        # _Ticker is set last, so once it is visible both globals are populated
+        _pd = pd
+        _Ticker = Ticker
+    return _pd, _Ticker
 
 # Initialize the MCP server
 mcp = FastMCP("yahoo-finance")
 
+# Shared pool for blocking yahooquery calls so tool invocations can overlap their HTTP I/O
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="yq")
+
+# yahooquery fetches each symbol of a multi-symbol Ticker concurrently with these options
+_TICKER_KW = dict(asynchronous=True, max_workers=8)
+
+# Ticker objects keyed by symbol set, so repeat calls reuse yahooquery's HTTP session and crumb
+_TICKER_CACHE: "OrderedDict[frozenset, Ticker]" = OrderedDict()
+_TICKER_CACHE_SIZE = 128
+_TICKER_CACHE_LOCK = threading.Lock()
+
+# Ticker warmed up at server start; new Tickers are copies of it, sharing its session and crumb
+_WARM_TICKER: Optional["Ticker"] = None
+
+# Helper function to get a (possibly cached) Ticker for a set of symbols
+def _get_ticker(symbols: Iterable[str]) -> "Ticker":
+    """Return a cached Ticker for the given symbols, creating it on first use."""
+    key = frozenset(symbols)
+    with _TICKER_CACHE_LOCK:
+        tickers = _TICKER_CACHE.get(key)
+        if tickers is not None:
+            _TICKER_CACHE.move_to_end(key)
+            return tickers
+    if _WARM_TICKER is not None:
+        # Constructing a Ticker always fetches a fresh crumb; a copy reuses the warm one
+        tickers = copy.copy(_WARM_TICKER)
+        tickers.symbols = sorted(key)
+        tickers.invalid_symbols = None
+    else:
+        _, Ticker = _lazy()
+        tickers = Ticker(sorted(key), **_TICKER_KW)
+    with _TICKER_CACHE_LOCK:
+        _TICKER_CACHE[key] = tickers
+        _TICKER_CACHE.move_to_end(key)
+        while len(_TICKER_CACHE) > _TICKER_CACHE_SIZE:
+            _TICKER_CACHE.popitem(last=False)
+    return tickers
+
+# Helper function to run a blocking call on the shared pool
+async def _run(func, *args, **kwargs) -> Any:
+    """Run a blocking callable in the yahooquery thread pool without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _EXECUTOR, functools.partial(func, *args, **kwargs)
+    )
+
+# Helper function to read a yahooquery attribute off the event loop
+async def _fetch(tickers: "Ticker", attr: str, call: bool = False, **kwargs) -> Any:
+    """Read (or call, for methods like balance_sheet) a Ticker attribute in the thread pool."""
+    if call:
+        return await _run(lambda: getattr(tickers, attr)(**kwargs))
+    return await _run(getattr, tickers, attr)
+
+# Yahoo symbols use many punctuation characters (BRK-B, M&M.NS, ^GSPC, GC=F, EURUSD=X), so only
+# reject what can never be part of one: whitespace, commas and control characters
+_SYM_RE = re.compile(r'^[^\s,\x00-\x1f\x7f]{1,20}$')
+
+# Helper function to parse the comma-separated symbols argument
+def _parse(symbols: str) -> List[str]:
+    """Split, normalise and validate a comma-separated list of symbols."""
+    out = [s for s in (s.strip().upper() for s in symbols.split(',')) if s]
+    bad = [s for s in out if not _SYM_RE.match(s)]
+    if bad:
+        raise ValueError(f"invalid symbols: {bad}")
+    if not out:
+        raise ValueError("no symbols given")
+    return out
+
+# Response cache lifetimes (seconds) per endpoint: quotes move by the second, statements by the quarter
+_CACHE_TTLS = {
+    "price": 15,
+    "financial_data": 60,
+    "summary_detail": 60,
+    "history": 60,
+    "technical_insights": 900,
+    "recommendation_trend": 3600,
+    "recommendations": 3600,
+    "earnings_trend": 3600,
+    "balance_sheet": 3600,
+    "cash_flow": 3600,
+    "income_statement": 3600,
+    "valuation_measures": 3600,
+    "major_holders": 3600,
+    "institution_ownership": 3600,
+    "insider_holders": 3600,
+    "insider_transactions": 3600,
+    "fund_ownership": 3600,
+    "earnings": 3600,
+    "calendar_events": 3600,
+    "asset_profile": 86400,
+    "summary_profile": 86400,
+    "company_officers": 86400,
+    "esg_scores": 86400,
+}
+_DEFAULT_CACHE_TTL = 300
+_CACHE: Dict[str, TTLCache] = {}
+
+# Helper function to get the response cache for an endpoint
+def _get_cache(endpoint: str) -> TTLCache:
+    """Return the TTL cache for an endpoint, creating it on first use."""
+    cache = _CACHE.get(endpoint)
+    if cache is None:
+        cache = _CACHE[endpoint] = TTLCache(256, _CACHE_TTLS.get(endpoint, _DEFAULT_CACHE_TTL))
+    return cache
+
+# Helper function to decide whether a response may be cached
+def _cacheable(data: Any) -> bool:
+    """Return False for yahooquery error strings (whole result or per symbol), which must not be replayed."""
+    if isinstance(data, str):
+        return False
+    if isinstance(data, dict):
+        return not any(isinstance(v, str) for v in data.values())
+    return True
+
+# Window (seconds) during which concurrent tool calls are coalesced into one request
+_BATCH_WINDOW = 0.02
+
+# Helper function to pick the requested symbols out of a batched response
+def _slice_symbols(data: Any, symbols: List[str]) -> Any:
+    """Return only the part of a multi-symbol yahooquery response for the given symbols."""
+    if isinstance(data, dict):
+        return {s: data.get(s) for s in symbols}
+    if _pd is not None and isinstance(data, _pd.DataFrame) and not data.empty and data.index.nlevels > 0:
+        return data[data.index.get_level_values(0).isin(symbols)]
+    return data
+
+class _Batcher:
+    """Coalesce concurrent requests for one yahooquery endpoint into a single Ticker call."""
+
+    def __init__(self, endpoint: str, frequency: Optional[str] = None):
+        self.endpoint = endpoint
+        self.frequency = frequency
+        self._waiters: List[tuple] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def fetch(self, symbols: List[str]) -> Any:
+        """Return cached data for the symbols, or queue them for the next flush."""
+        cache = _get_cache(self.endpoint)
+        key = (tuple(symbols), self.frequency)
+        hit = cache.get(key)
+        if hit is not None:
+            return hit
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._waiters.append((symbols, future))
+        if len(self._waiters) == 1:
+            loop.call_later(_BATCH_WINDOW, self._schedule_flush, loop)
+        data = await future
+        if _cacheable(data):
+            cache[key] = data
+        return data
+
+    def _schedule_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start the flush, keeping a reference so the task is not garbage collected."""
+        self._flush_task = loop.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        """Fetch every pending symbol at once and fan the result back out."""
+        waiters, self._waiters = self._waiters, []
+        symbols = list(dict.fromkeys(s for requested, _ in waiters for s in requested))
+        try:
+            tickers = await _run(_get_ticker, symbols)
+            if self.frequency is not None:
+                data = await _fetch(tickers, self.endpoint, call=True, frequency=self.frequency)
+            else:
+                data = await _fetch(tickers, self.endpoint)
+        except Exception as e:
+            for _, future in waiters:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for requested, future in waiters:
+            if not future.done():
+                future.set_result(_slice_symbols(data, requested))
+
+@functools.lru_cache(maxsize=None)
+def _get_batcher(endpoint: str, frequency: Optional[str] = None) -> _Batcher:
+    """Return the shared batcher for an endpoint/frequency pair."""
+    return _Batcher(endpoint, frequency)
+
+# Helper function to serialize data to a JSON string
+def _dumps(data: Any, pretty: bool = False) -> str:
+    """Serialize data to compact (or, with pretty=True, indented) JSON, using orjson when installed."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option, default=str).decode()
+    if pretty:
+        return json.dumps(data, indent=2, default=str)
+    return json.dumps(data, separators=(',', ':'), default=str)
+
 # Helper function to convert pandas objects to JSON-serializable format
-def convert_to_json_serializable(data: Any) -> Any:
+def convert_to_json_serializable(data: Any, columnar: bool = True) -> Any:
     """Convert pandas DataFrames and other objects to JSON-serializable format."""
+    pd = _pd
+    if pd is None:
+        # Nothing has been fetched yet, so there are no pandas objects to convert
+        return data
     if isinstance(data, pd.DataFrame):
         # Reset index to make it a column if it has meaningful data
         if data.index.name or not isinstance(data.index, pd.RangeIndex):
             data = data.reset_index()
+        if columnar:
+            # One list per column instead of one dict per row
+            return {c: data[c].tolist() for c in data.columns}
         return data.to_dict(orient='records')
     elif isinstance(data, pd.Series):
         return data.to_dict()
     elif isinstance(data, dict):
-        return {k: convert_to_json_serializable(v) for k, v in data.items()}
+        return {k: convert_to_json_serializable(v, columnar) for k, v in data.items()}
     elif isinstance(data, (list, tuple)):
-        return [convert_to_json_serializable(item) for item in data]
-    elif pd.isna(data):
+        return [convert_to_json_serializable(item, columnar) for item in data]
+    elif data is None or data is pd.NaT or (isinstance(data, float) and math.isnan(data)):
         return None
     else:
         return data
 
 # Helper function to format response
-def format_response(data: Any, title: str) -> str:
-    """Format the response data as a readable string."""
+def format_response(data: Any, title: str, columnar: bool = True, pretty: bool = False) -> str:
+    """Format the response data as a string.
+
+    DataFrames are emitted column-wise ({column: [values]}) by default; pass
+    columnar=False for a list of row records. JSON is compact unless pretty=True.
+    """
     try:
-        json_data = convert_to_json_serializable(data)
+        pd = _pd
+        if pd is not None and isinstance(data, pd.DataFrame):
+            if data.empty:
+                return f"{title}: No data available"
+            if not columnar:
+                # Row records are produced by pandas' C serializer instead of the recursive path
+                if data.index.name or not isinstance(data.index, pd.RangeIndex):
+                    data = data.reset_index()
+                body = data.to_json(orient='records', date_format='iso', indent=2 if pretty else 0, default_handler=str)
+                return f"{title}:\n{body}"
+
+        json_data = convert_to_json_serializable(data, columnar)
         if json_data is None or (isinstance(json_data, list) and len(json_data) == 0):
             return f"{title}: No data available"
         
-        # Pretty print JSON for readability
-        return f"{title}:\n{json.dumps(json_data, indent=2, default=str)}"
+        return f"{title}:\n{_dumps(json_data, pretty)}"
     except Exception as e:
         return f"{title}: Error formatting data - {str(e)}"
 
-@mcp.tool()
-async def get_financial_data(symbols: str) -> str:
-    """
-    Get financial data for given stock symbols.
+# Default help text for the symbols argument
+_SYMBOLS_HELP = "Comma-separated list of stock symbols"
+
+# (tool name, yahooquery endpoint, response title, description, symbols help) for tools that return one endpoint
+_SIMPLE_ENDPOINTS = [
+    ("get_financial_data", "financial_data", "Financial Data", "Get financial data for given stock symbols.",
+     'Comma-separated list of stock symbols (e.g., "AAPL,GOOGL,MSFT")'),
+    ("get_valuation_measures", "valuation_measures", "Valuation Measures", "Get valuation measures for given stock symbols.", _SYMBOLS_HELP),
+    ("get_earnings", "earnings", "Earnings", "Get earnings data for given stock symbols.", _SYMBOLS_HELP),
+    ("get_earnings_trend", "earnings_trend", "Earnings Trend", "Get earnings trend data for given stock symbols.", _SYMBOLS_HELP),
+    ("get_major_holders", "major_holders", "Major Holders", "Get major holders information for given stock symbols.", _SYMBOLS_HELP),
+    ("get_institution_ownership", "institution_ownership", "Institution Ownership", "Get institutional ownership data for given stock symbols.", _SYMBOLS_HELP),
+    ("get_insider_holders", "insider_holders", "Insider Holders", "Get insider holders information for given stock symbols.", _SYMBOLS_HELP),
+    ("get_insider_transactions", "insider_transactions", "Insider Transactions", "Get insider transactions for given stock symbols.", _SYMBOLS_HELP),
+    ("get_fund_ownership", "fund_ownership", "Fund Ownership", "Get fund ownership data for given stock symbols.", _SYMBOLS_HELP),
+    ("get_recommendations", "recommendations", "Recommendations", "Get analyst recommendations for given stock symbols.", _SYMBOLS_HELP),
+    ("get_recommendation_trend", "recommendation_trend", "Recommendation Trend", "Get recommendation trends for given stock symbols.", _SYMBOLS_HELP),
+    ("get_price_data", "price", "Price Data", "Get current price data for given stock symbols.", _SYMBOLS_HELP),
+    ("get_summary_detail", "summary_detail", "Summary Detail", "Get summary details for given stock symbols.", _SYMBOLS_HELP),
+    ("get_company_officers", "company_officers", "Company Officers", "Get company officers information for given stock symbols.", _SYMBOLS_HELP),
+    ("get_technical_insights", "technical_insights", "Technical Insights", "Get technical insights for given stock symbols.", _SYMBOLS_HELP),
+    ("get_calendar_events", "calendar_events", "Calendar Events", "Get calendar events for given stock symbols.", _SYMBOLS_HELP),
+    ("get_esg_scores", "esg_scores", "ESG Scores", "Get ESG (Environmental, Social, Governance) scores for given stock symbols.", _SYMBOLS_HELP),
+]
+
+# Same, for financial statements that take an annual/quarterly frequency
+_STATEMENT_ENDPOINTS = [
+    ("get_balance_sheet", "balance_sheet", "Balance Sheet", "Get balance sheet data for given stock symbols."),
+    ("get_cash_flow", "cash_flow", "Cash Flow", "Get cash flow statement for given stock symbols."),
+    ("get_income_statement", "income_statement", "Income Statement", "Get income statement for given stock symbols."),
+]
+
+# Helper function to build a tool for a single yahooquery endpoint
+def _make_simple_tool(name: str, endpoint: str, title: str, description: str, symbols_help: str):
+    """Create the tool coroutine for an endpoint that only takes symbols."""
+    async def tool(symbols: str) -> str:
+        ticker_list = _parse(symbols)
+        data = await _get_batcher(endpoint).fetch(ticker_list)
+        return format_response(data, title)
+
+    tool.__name__ = tool.__qualname__ = name
+    tool.__doc__ = f"""
+    {description}
     
     Args:
-        symbols: Comma-separated list of stock symbols (e.g., "AAPL,GOOGL,MSFT")
-    """
-    ticker_list = [s.strip().upper() for s in symbols.split(',')]
-    tickers = Ticker(ticker_list)
-    data = tickers.financial_data
-    return format_response(data, "Financial Data")
-
-@mcp.tool()
-async def get_balance_sheet(symbols: str, frequency: str = "annual") -> str:
-    """
-    Get balance sheet data for given stock symbols.
-    
-    Args:
-        symbols: Comma-separated list of stock symbols
-        frequency: "annual" or "quarterly"
-    """
-    ticker_list = [s.strip().upper() for s in symbols.split(',')]
-    tickers = Ticker(ticker_list)
-    data = tickers.balance_sheet(frequency=frequency)
-    return format_response(data, f"Balance Sheet ({frequency})")
-
-@mcp.tool()
-async def get_cash_flow(symbols: str, frequency: str = "annual") -> str:
-    """
-    Get cash flow statement for given stock symbols.
+        symbols: {symbols_help}
+    """
+    return tool
+
+# Statement frequencies accepted by yahooquery
+_FREQUENCIES = ("annual", "quarterly")
+
+# Helper function to build a tool for a financial statement endpoint
+def _make_statement_tool(name: str, endpoint: str, title: str, description: str):
+    """Create the tool coroutine for a statement endpoint that also takes a frequency."""
+    async def tool(symbols: str, frequency: str = "annual") -> str:
+        ticker_list = _parse(symbols)
+        # Batchers are kept per frequency, so only accept the two Yahoo supports
+        if frequency not in _FREQUENCIES:
+            raise ValueError(f"invalid frequency: {frequency!r} (expected 'annual' or 'quarterly')")
+        data = await _get_batcher(endpoint, frequency).fetch(ticker_list)
+        return format_response(data, f"{title} ({frequency})")
+
+    tool.__name__ = tool.__qualname__ = name
+    tool.__doc__ = f"""
+    {description}
     
     Args:
         symbols: Comma-separated list of stock symbols
         frequency: "annual" or "quarterly"
     """
-    ticker_list = [s.strip().upper() for s in symbols.split(',')]
-    tickers = Ticker(ticker_list)
-    data = tickers.cash_flow(frequency=frequency)
-    return format_response(data, f"Cash Flow ({frequency})")
+    return tool
 
-@mcp.tool()
-async def get_income_statement(symbols: str, frequency: str = "annual") -> str:
-    """
-    Get income statement for given stock symbols.
-    
-    Args:
-        symbols: Comma-separated list of stock symbols
-        frequency: "annual" or "quarterly"
-    """
-    ticker_list = [s.strip().upper() for s in symbols.split(',')]
-    tickers = Ticker(ticker_list)
-    data = tickers.income_statement(frequency=frequency)
-    return format_response(data, f"Income Statement ({frequency})")
+# Register the generated tools, keeping them importable as module attributes
+for _name, _endpoint, _title, _description, _symbols_help in _SIMPLE_ENDPOINTS:
+    globals()[_name] = mcp.tool()(_make_simple_tool(_name, _endpoint, _title, _description, _symbols_help))
 
-@mcp.tool()
-async def get_valuation_measures(symbols: str) -> str:
-    """
-    Get valuation measures for given stock symbols.
-    
-    Args:
-        symbols: Comma-separated list of stock symbols
-    """
-    ticker_list = [s.strip().upper() for s in symbols.split(',')]
-    tickers = Ticker(ticker_list)
-    data = tickers.valuation_measures
-    return format_response(data, "Valuation Measures")
-
-@mcp.tool()
-async def get_earnings(symbols: str) -> str:
-    """
-    Get earnings data for given stock symbols.
-    
-    Args:
-        symbols: Comma-separated list of stock symbols
-    """
-    ticker_list = [s.strip().upper() for s in symbols.split(',')]
-    tickers = Ticker(ticker_list)
-    data = tickers.earnings
-    return format_response(data, "Earnings")
-
-@mcp.tool()
-async def get_earnings_trend(symbols: str) -> str:
-    """
-    Get earnings trend data for given stock symbols.
-    
-    Args:
-        symbols: Comma-separated list of stock symbols
-    """
-    ticker_list = [s.strip().upper() for s in symbols.split(',')]
-    tickers = Ticker(ticker_list)
-    data = tickers.earnings_trend
-    return format_response(data, "Earnings Trend")
-
-@mcp.tool()
-async def get_major_holders(symbols: str) -> str:
-    """
-    Get major holders information for given stock symbols.
-    
-    Args:
-        symbols: Comma-separated list of stock symbols
-    """
-    ticker_list = [s.strip().upper() for s in symbols.split(',')]
-    tickers = Ticker(ticker_list)
-    data = tickers.major_holders
-    return format_response(data, "Major Holders")
-
-@mcp.tool()
-async def get_institution_ownership(symbols: str) -> str:
-    """
-    Get institutional ownership data for given stock symbols.
-    
-    Args:
-        symbols: Comma-separated list of stock symbols
-    """
-    ticker_list = [s.strip().upper() for s in symbols.split(',')]
-    tickers = Ticker(ticker_list)
-    data = tickers.institution_ownership
-    return format_response(data, "Institution Ownership")
-
-@mcp.tool()
-async def get_insider_holders(symbols: str) -> str:
-    """
-    Get insider holders information for given stock symbols.
-    
-    Args:
-        symbols: Comma-separated list of stock symbols
-    """
-    ticker_list = [s.strip().upper() for s in symbols.split(',')]
-    tickers = Ticker(ticker_list)
-    data = tickers.insider_holders
-    return format_response(data, "Insider Holders")
-
-@mcp.tool()
-async def get_insider_transactions(symbols: str) -> str:
-    """
-    Get insider transactions for given stock symbols.
-    
-    Args:
-        symbols: Comma-separated list of stock symbols
-    """
-    ticker_list = [s.strip().upper() for s in symbols.split(',')]
-    tickers = Ticker(ticker_list)
-    data = tickers.insider_transactions
-    return format_response(data, "Insider Transactions")
-
-@mcp.tool()
-async def get_fund_ownership(symbols: str) -> str:
-    """
-    Get fund ownership data for given stock symbols.
-    
-    Args:
-        symbols: Comma-separated list of stock symbols
-    """
-    ticker_list = [s.strip().upper() for s in symbols.split(',')]
-    tickers = Ticker(ticker_list)
-    data = tickers.fund_ownership
-    return format_response(data, "Fund Ownership")
-
-@mcp.tool()
-async def get_recommendations(symbols: str) -> str:
-    """
-    Get analyst recommendations for given stock symbols.
-    
-    Args:
-        symbols: Comma-separated list of stock symbols
-    """
-    ticker_list = [s.strip().upper() for s in symbols.split(',')]
-    tickers = Ticker(ticker_list)
-    data = tickers.recommendations
-    return format_response(data, "Recommendations")
-
-@mcp.tool()
-async def get_recommendation_trend(symbols: str) -> str:
-    """
-    Get recommendation trends for given stock symbols.
-    
-    Args:
-        symbols: Comma-separated list of stock symbols
-    """
-    ticker_list = [s.strip().upper() for s in symbols.split(',')]
-    tickers = Ticker(ticker_list)
-    data = tickers.recommendation_trend
-    return format_response(data, "Recommendation Trend")
-
-@mcp.tool()
-async def get_price_data(symbols: str) -> str:
-    """
-    Get current price data for given stock symbols.
-    
-    Args:
-        symbols: Comma-separated list of stock symbols
-    """
-    ticker_list = [s.strip().upper() for s in symbols.split(',')]
-    tickers = Ticker(ticker_list)
-    data = tickers.price
-    return format_response(data, "Price Data")
-
-@mcp.tool()
-async def get_summary_detail(symbols: str) -> str:
-    """
-    Get summary details for given stock symbols.
-    
-    Args:
-        symbols: Comma-separated list of stock symbols
-    """
-    ticker_list = [s.strip().upper() for s in symbols.split(',')]
-    tickers = Ticker(ticker_list)
-    data = tickers.summary_detail
-    return format_response(data, "Summary Detail")
+for _name, _endpoint, _title, _description in _STATEMENT_ENDPOINTS:
+    globals()[_name] = mcp.tool()(_make_statement_tool(_name, _endpoint, _title, _description))
 
 @mcp.tool()
 async def get_company_profile(symbols: str) -> str:
@@ -269,12 +386,13 @@ async def get_company_profile(symbols: str) -> str:
     Args:
         symbols: Comma-separated list of stock symbols
     """
-    ticker_list = [s.strip().upper() for s in symbols.split(',')]
-    tickers = Ticker(ticker_list)
+    ticker_list = _parse(symbols)
     
     # Combine asset_profile and summary_profile
-    asset_profile = tickers.asset_profile
-    summary_profile = tickers.summary_profile
+    asset_profile, summary_profile = await asyncio.gather(
+        _get_batcher("asset_profile").fetch(ticker_list),
+        _get_batcher("summary_profile").fetch(ticker_list),
+    )
     
     combined_data = {
         "asset_profile": convert_to_json_serializable(asset_profile),
@@ -283,58 +401,6 @@ async def get_company_profile(symbols: str) -> str:
     
     return format_response(combined_data, "Company Profile")
 
-@mcp.tool()
-async def get_company_officers(symbols: str) -> str:
-    """
-    Get company officers information for given stock symbols.
-    
-    Args:
-        symbols: Comma-separated list of stock symbols
-    """
-    ticker_list = [s.strip().upper() for s in symbols.split(',')]
-    tickers = Ticker(ticker_list)
-    data = tickers.company_officers
-    return format_response(data, "Company Officers")
-
-@mcp.tool()
-async def get_technical_insights(symbols: str) -> str:
-    """
-    Get technical insights for given stock symbols.
-    
-    Args:
-        symbols: Comma-separated list of stock symbols
-    """
-    ticker_list = [s.strip().upper() for s in symbols.split(',')]
-    tickers = Ticker(ticker_list)
-    data = tickers.technical_insights
-    return format_response(data, "Technical Insights")
-
-@mcp.tool()
-async def get_calendar_events(symbols: str) -> str:
-    """
-    Get calendar events for given stock symbols.
-    
-    Args:
-        symbols: Comma-separated list of stock symbols
-    """
-    ticker_list = [s.strip().upper() for s in symbols.split(',')]
-    tickers = Ticker(ticker_list)
-    data = tickers.calendar_events
-    return format_response(data, "Calendar Events")
-
-@mcp.tool()
-async def get_esg_scores(symbols: str) -> str:
-    """
-    Get ESG (Environmental, Social, Governance) scores for given stock symbols.
-    
-    Args:
-        symbols: Comma-separated list of stock symbols
-    """
-    ticker_list = [s.strip().upper() for s in symbols.split(',')]
-    tickers = Ticker(ticker_list)
-    data = tickers.esg_scores
-    return format_response(data, "ESG Scores")
-
 @mcp.tool()
 async def get_historical_prices(
     symbols: str,
@@ -354,8 +420,7 @@ async def get_historical_prices(
         end_date: End date in YYYY-MM-DD format (optional if using period)
         interval: Data interval ("1m", "2m", "5m", "15m", "30m", "60m", "90m", "1d", "5d", "1wk", "1mo", "3mo")
     """
-    ticker_list = [s.strip().upper() for s in symbols.split(',')]
-    tickers = Ticker(ticker_list)
+    ticker_list = _parse(symbols)
     
     # Prepare parameters
     params = {
@@ -377,22 +442,38 @@ async def get_historical_prices(
         params["start"] = start_date
         params["end"] = end_date
     
-    data = tickers.history(**params)
+    cache = _get_cache("history")
+    key = (tuple(ticker_list), tuple(sorted(params.items())))
+    data = cache.get(key)
+    if data is None:
+        tickers = await _run(_get_ticker, ticker_list)
+        data = await _fetch(tickers, "history", call=True, **params)
+        if _cacheable(data):
+            cache[key] = data
     
-    # Format the historical data with proper date handling
-    if isinstance(data, pd.DataFrame) and not data.empty:
-        # Reset index to include date and symbol as columns
-        data = data.reset_index()
-        
-        # Convert date to string for JSON serialization
-        if 'date' in data.columns:
-            data['date'] = data['date'].astype(str)
-        
-        json_data = data.to_dict(orient='records')
-        return f"Historical Price Data ({interval}):\n{json.dumps(json_data, indent=2, default=str)}"
+    # Format the historical data with proper date handling; pandas was imported on the pool by _get_ticker
+    pd = _pd
+    if pd is not None and isinstance(data, pd.DataFrame) and not data.empty:
+        # Read symbol and date straight off the index instead of copying the frame with reset_index
+        json_data = {}
+        for name in data.index.names:
+            values = data.index.get_level_values(name)
+            # Convert date to string for JSON serialization
+            if name == 'date':
+                values = values.astype(str)
+            json_data[name] = values.tolist()
+        for c in data.columns:
+            json_data[c] = data[c].to_numpy().tolist()
+        return f"Historical Price Data ({interval}):\n{_dumps(json_data)}"
     else:
         return "Historical Price Data: No data available"
 
+# Helper function to run a symbol search on the thread pool
+def _search(query: str) -> Any:
+    """Import yahooquery (if needed) and search it; both block, so this runs via _run."""
+    from yahooquery import search
+    return search(query)
+
 @mcp.tool()
 async def search_symbols(query: str) -> str:
     """
@@ -402,9 +483,8 @@ async def search_symbols(query: str) -> str:
         query: Search query (company name or partial symbol)
     """
     try:
-        # Use Ticker's search functionality
-        from yahooquery import search
-        results = search(query)
+        # Use yahooquery's search functionality (imported on the pool, see _search)
+        results = await _run(_search, query)
         
         if results and 'quotes' in results:
             quotes = results['quotes']
@@ -419,24 +499,42 @@ async def search_symbols(query: str) -> str:
                 }
                 formatted_results.append(result)
             
-            return f"Search Results for '{query}':\n{json.dumps(formatted_results, indent=2)}"
+            return f"Search Results for '{query}':\n{_dumps(formatted_results)}"
         else:
             return f"No results found for '{query}'"
     except Exception as e:
         return f"Error searching symbols: {str(e)}"
 
-# Run the server
-if __name__ == "__main__":
-    mcp.run(transport='stdio')
-
+# Helper function to pay yahooquery's session setup cost before the first tool call
+async def _warmup() -> None:
+    """Create a Ticker and fetch one quote so the first real tool call hits a warm session."""
+    global _WARM_TICKER
+    try:
+        tickers = await _run(_get_ticker, ["AAPL"])
+        await _fetch(tickers, "price")
+        # Only share the session if it actually obtained a crumb
+        if tickers.crumb:
+            _WARM_TICKER = tickers
+    except Exception:
+        # Warm-up is best effort; tools will set up their own session if it failed
+        pass
+
+async def _serve() -> None:
+    """Start the warm-up in the background and serve MCP over stdio."""
+    warmup = asyncio.create_task(_warmup())
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        warmup.cancel()
 
+# Run the server
 def main():
     """Entry point for the alex-mcp command."""
-    import sys
+    # Use the libuv-based event loop when available; asyncio.run picks up the policy
+    if uvloop is not None:
+        uvloop.install()
     
-    # When installed as a package, the src directory is not in the path
-    asyncio.run(mcp.run(transport='stdio'))
-    print("  MCP Server started successfully.")
+    asyncio.run(_serve())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -5,8 +5,17 @@ Validation script to test Zentickr setup and functionality
 
 import sys
 import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+def _try_import(dep):
+    """Try to import a dependency, returning whether it is available"""
+    try:
+        __import__(dep)
+        return True
+    except ImportError:
+        return False
+
 def check_dependencies():
     """Check if all required dependencies are available"""
     dependencies = [
@@ -18,12 +27,15 @@ def check_dependencies():
         'asyncio'
     ]
     
+    # Import everything concurrently; results come back in order for printing
+    with ThreadPoolExecutor(len(dependencies)) as executor:
+        results = list(executor.map(_try_import, dependencies))
+    
     missing = []
-    for dep in dependencies:
-        try:
-            __import__(dep)
+    for dep, found in zip(dependencies, results):
+        if found:
             print(f"✅ {dep}")
-        except ImportError:
+        else:
             print(f"❌ {dep} - NOT FOUND")
             missing.append(dep)
     